@@ -0,0 +1,94 @@
+"""
+Order book snapshots from the Polymarket CLOB market WebSocket channel.
+"""
+import asyncio
+import orjson
+import websockets
+from typing import List, Dict, Any, Iterable
+
+WS_MARKET_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+
+# Seconds to wait for the first book snapshot of every subscribed token
+SNAPSHOT_TIMEOUT = 10.0
+
+
+def apply_event(books: Dict[str, Dict[str, List[Dict[str, Any]]]], event: Dict[str, Any]) -> None:
+    """
+    Update local order books from a single market channel event.
+    
+    'book' events replace a token's book; 'price_change' events set the size
+    of individual price levels (size 0 removes the level). Other events are
+    ignored.
+    
+    Args:
+        books: Local order books keyed by token ID, updated in place
+        event: Decoded WebSocket event
+    """
+    event_type = event.get('event_type')
+    
+    if event_type == 'book':
+        books[event['asset_id']] = {
+            'bids': list(event.get('bids', event.get('buys')) or []),
+            'asks': list(event.get('asks', event.get('sells')) or [])
+        }
+    
+    elif event_type == 'price_change':
+        for change in event.get('price_changes') or event.get('changes') or []:
+            book = books.get(change.get('asset_id', event.get('asset_id')))
+            if book is None:
+                # No snapshot yet, nothing to apply the change to
+                continue
+            
+            levels = book['bids'] if change.get('side') == 'BUY' else book['asks']
+            price = float(change['price'])
+            levels[:] = [level for level in levels if float(level['price']) != price]
+            if float(change.get('size') or 0) > 0:
+                levels.append({'price': change['price'], 'size': change['size']})
+
+
+async def _receive_snapshots(websocket, books: Dict[str, Dict[str, List[Dict[str, Any]]]],
+                             pending: set) -> None:
+    """Apply incoming events until every pending token has a book snapshot."""
+    while pending:
+        message = await websocket.recv()
+        try:
+            payload = orjson.loads(message)
+        except orjson.JSONDecodeError:
+            # Keep-alive replies such as 'PONG' are not JSON
+            continue
+        
+        for event in payload if isinstance(payload, list) else [payload]:
+            if isinstance(event, dict):
+                apply_event(books, event)
+                if event.get('event_type') == 'book':
+                    pending.discard(event.get('asset_id'))
+
+
+async def fetch_order_books(token_ids: Iterable[str],
+                            timeout: float = SNAPSHOT_TIMEOUT) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """
+    Subscribe to the market channel and collect one book snapshot per token.
+    
+    Args:
+        token_ids: Token IDs to subscribe to
+        timeout: Seconds to wait for all snapshots before giving up
+    
+    Returns:
+        Dictionary mapping token IDs to {'bids': [...], 'asks': [...]}. Tokens
+        whose snapshot did not arrive in time are missing from the result.
+    """
+    books = {}
+    pending = set(token_ids)
+    if not pending:
+        return books
+    
+    try:
+        async with websockets.connect(WS_MARKET_URL) as websocket:
+            await websocket.send(orjson.dumps({'type': 'market', 'assets_ids': list(pending)}).decode())
+            await asyncio.wait_for(_receive_snapshots(websocket, books, pending), timeout)
+    except asyncio.TimeoutError:
+        print(f"Timed out waiting for {len(pending)} order book snapshots")
+    except Exception as e:
+        print(f"Error reading CLOB WebSocket: {e}")
+    
+    return books
@@ -2,278 +2,493 @@
 Script to fetch odds for all cryptocurrency related markets on Polymarket.
 """
 from py_clob_client.client import ClobClient
-import json
+from clob_ws import fetch_order_books
+from filters import MARKET_TEXT_FIELDS, get_pattern, search_column
+import asyncio
 import httpx
-from typing import List, Dict, Any
+import orjson
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 
+CLOB_HOST = "https://clob.polymarket.com"
 
-def filter_crypto_markets(markets: Dict[str, Any]) -> List[Dict[str, Any]]:
+GAMMA_HOST = "https://gamma-api.polymarket.com"
+
+# Upper bound on concurrent connections used for Gamma and CLOB reads
+MAX_CONNECTIONS = 50
+
+# Markets requested per Gamma API page; pages are fetched concurrently
+GAMMA_PAGE_SIZE = 500
+
+# Ask for compressed responses; httpx decodes gzip, and br via brotli
+COMPRESSED_HEADERS = {'Accept-Encoding': 'gzip, br'}
+
+# Compiled once in filters.py
+CRYPTO_PATTERN = get_pattern('crypto')
+
+
+@lru_cache(maxsize=8192)
+def _parse_json_str(raw: str) -> Any:
     """
-    Filter markets to only include those related to cryptocurrencies.
+    Parse a JSON-encoded market field such as outcomes or outcomePrices.
+    
+    Results are cached by the raw string, since many markets share the same
+    values (e.g. '["Yes", "No"]'). Callers must not mutate the result.
+    """
+    return orjson.loads(raw)
+
+
+def _parse_outcome_names(outcomes: Any) -> List[str]:
+    """Extract outcome names from a raw outcomes field (JSON string, list or dict)."""
+    if isinstance(outcomes, str):
+        try:
+            outcomes = _parse_json_str(outcomes)
+        except orjson.JSONDecodeError:
+            return []
+    
+    outcome_names = []
+    if isinstance(outcomes, dict):
+        outcome_names = list(outcomes.values())
+    elif isinstance(outcomes, list):
+        for outcome in outcomes:
+            if isinstance(outcome, str):
+                outcome_names.append(outcome)
+            elif isinstance(outcome, dict):
+                outcome_names.append(outcome.get('name', outcome.get('title', 'Unknown')))
+    
+    # Names are used as token map keys, so they must all be strings
+    return [name if isinstance(name, str) else str(name) for name in outcome_names]
+
+
+def _parse_outcome_prices(outcome_prices: Any, count: int) -> List[Optional[float]]:
+    """Parse a raw outcomePrices field into one float (or None) per outcome."""
+    if isinstance(outcome_prices, str):
+        try:
+            outcome_prices = _parse_json_str(outcome_prices)
+        except orjson.JSONDecodeError:
+            outcome_prices = []
+    
+    # The decoded value is as loosely typed as the raw field
+    if isinstance(outcome_prices, dict):
+        outcome_prices = list(outcome_prices.values())
+    elif not isinstance(outcome_prices, list):
+        outcome_prices = []
+    
+    # Index in outcomePrices corresponds to outcome index. Convert the whole
+    # list in one map() call and only fall back to per-element parsing when
+    # a value is malformed.
+    outcome_prices = outcome_prices[:count]
+    try:
+        prices = list(map(float, outcome_prices))
+    except (ValueError, TypeError):
+        prices = []
+        for value in outcome_prices:
+            try:
+                prices.append(float(value))
+            except (ValueError, TypeError):
+                prices.append(None)
+    
+    prices.extend([None] * (count - len(prices)))
+    return prices
+
+
+def _outcome_search_text(market: Dict[str, Any], outcome_names: List[str]) -> str:
+    """Join outcome names, outcome dict fields and token outcomes for searching."""
+    parts = [str(name) for name in outcome_names]
+    
+    outcomes = market.get('outcomes')
+    if isinstance(outcomes, list):
+        for outcome in outcomes:
+            if isinstance(outcome, dict):
+                parts.extend(str(outcome.get(field) or '') for field in ('text', 'outcome'))
+    
+    tokens = market.get('tokens')
+    if isinstance(tokens, list):
+        for token in tokens:
+            if isinstance(token, dict):
+                parts.append(str(token.get('outcome') or ''))
+    
+    return ' '.join(parts)
+
+
+def normalize_markets(markets: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Normalize raw markets into parallel, uniformly typed columns.
+    
+    All type checks on the loosely structured API data happen here, once
+    per market, so filtering and odds lookups can loop over plain lists.
     
     Args:
-        markets: Dictionary containing market data from get_simplified_markets()
+        markets: List of market dictionaries from the Gamma API
         
     Returns:
-        List of markets that contain crypto-related terms in their title or description
+        Dictionary of equal-length lists: 'markets' (the raw dicts),
+        one str column per MARKET_TEXT_FIELDS entry, 'condition_ids',
+        'outcome_names' and 'outcome_prices'
     """
-    crypto_markets = []
-    search_terms = [
-        'bitcoin', 'btc', 'ethereum', 'eth', 'cryptocurrency',
-        'solana', 'sol ', 'cardano', 'ada ', 'polygon', 'matic',
-        'avalanche', 'avax', 'chainlink', 'link ', 'uniswap', 'uni ',
-        'litecoin', 'ltc', 'dogecoin', 'doge', 'xrp', 'ripple',
-        'polkadot', 'dot ', 'cosmos', 'atom ', 'algorand', 'algo ',
-        'shiba', 'shib', 'tether', 'usdt', 'usdc', 'binance', 'bnb',
-        'terra', 'luna', 'stellar', 'xlm', 'monero', 'xmr',
-        'eos', 'tezos', 'xtz', 'dash', 'zcash', 'zec',
-        'defi', 'web3', 'blockchain'
-    ]
-    
-    if 'data' not in markets:
-        return crypto_markets
+    columns = {
+        'markets': [],
+        'condition_ids': [],
+        'outcome_names': [],
+        'outcome_prices': []
+    }
+    for field in MARKET_TEXT_FIELDS:
+        columns[field] = []
     
-    for market in markets['data']:
+    for market in markets:
         if not isinstance(market, dict):
             continue
-            
-        # Check various fields for cryptocurrency related content
-        # Try all possible field names from Gamma API
-        market_text = ' '.join([
-            str(market.get('question', '')),
-            str(market.get('description', '')),
-            str(market.get('slug', '')),
-            str(market.get('title', '')),
-            str(market.get('name', '')),
-            str(market.get('text', '')),
-            str(market.get('market', '')),
-            str(market.get('condition', '')),
-            str(market.get('conditionId', '')),
-            str(market.get('condition_id', '')),
-        ]).lower()
         
-        # Also check outcomes if they exist
-        outcomes = market.get('outcomes', [])
-        if outcomes:
-            for outcome in outcomes:
-                if isinstance(outcome, dict):
-                    market_text += ' ' + ' '.join([
-                        str(outcome.get('title', '')),
-                        str(outcome.get('name', '')),
-                        str(outcome.get('text', '')),
-                        str(outcome.get('outcome', ''))
-                    ]).lower()
+        columns['markets'].append(market)
+        for field in MARKET_TEXT_FIELDS:
+            value = market.get(field)
+            columns[field].append(value if isinstance(value, str) else str(value) if value else '')
         
-        # Also check tokens if they exist
-        tokens = market.get('tokens', [])
-        if tokens:
-            for token in tokens:
-                if isinstance(token, dict):
-                    market_text += ' ' + str(token.get('outcome', '')).lower()
+        outcome_names = _parse_outcome_names(market.get('outcomes', []))
+        columns['outcome_names'].append(outcome_names)
+        columns['outcome_prices'].append(
+            _parse_outcome_prices(market.get('outcomePrices', []), len(outcome_names))
+        )
+        columns['condition_ids'].append(market.get('conditionId') or market.get('condition_id'))
+    
+    return columns
+
+
+def filter_crypto_markets(columns: Dict[str, List[Any]]) -> List[int]:
+    """
+    Filter markets to only include those related to cryptocurrencies.
+    
+    Each column is searched in one sweep, in MARKET_TEXT_FIELDS order;
+    rows that already matched are left out of later columns. Outcome and
+    token text is only assembled for rows none of those fields matched.
+    
+    Args:
+        columns: Normalized market columns from normalize_markets()
         
-        # Check if any search term appears in the market text
-        if any(term in market_text for term in search_terms):
-            crypto_markets.append(market)
+    Returns:
+        Row indices of markets that contain crypto-related terms, ascending
+    """
+    markets = columns['markets']
+    remaining = list(range(len(markets)))
+    matched = set()
+    
+    for field in MARKET_TEXT_FIELDS:
+        if not remaining:
+            break
+        hits = search_column(CRYPTO_PATTERN, columns[field], remaining)
+        if hits:
+            matched.update(hits)
+            remaining = [row for row in remaining if row not in matched]
+    
+    # Also check outcomes and tokens, only for markets not matched yet
+    if remaining:
+        outcome_text = [''] * len(markets)
+        for row in remaining:
+            outcome_text[row] = _outcome_search_text(markets[row], columns['outcome_names'][row])
+        matched.update(search_column(CRYPTO_PATTERN, outcome_text, remaining))
     
-    return crypto_markets
+    return sorted(matched)
 
 
-def get_token_ids_for_condition(client: ClobClient, condition_id: str) -> Dict[str, str]:
+def fetch_token_maps(client: ClobClient) -> Dict[str, Dict[str, str]]:
     """
-    Get token IDs for a condition by fetching from simplified markets.
+    Fetch simplified markets once and build token maps for every condition.
     
     Args:
         client: ClobClient instance
-        condition_id: The condition ID to look up
         
     Returns:
-        Dictionary mapping outcome names to token IDs
+        Dictionary mapping condition IDs to {outcome name: token ID}
     """
-    token_map = {}
+    token_maps = {}
     try:
         simplified = client.get_simplified_markets()
-        markets_list = simplified.get('data', [])
-        
-        for market in markets_list:
-            if market.get('condition_id') == condition_id:
-                tokens = market.get('tokens', [])
-                for token in tokens:
-                    if isinstance(token, dict):
-                        outcome = token.get('outcome', '')
-                        token_id = token.get('token_id')
-                        if outcome and token_id:
-                            token_map[outcome] = str(token_id)
-                break
+        for market in simplified.get('data', []):
+            condition_id = market.get('condition_id')
+            if not condition_id:
+                continue
+            token_map = {}
+            for token in market.get('tokens', []):
+                if isinstance(token, dict):
+                    outcome = token.get('outcome', '')
+                    token_id = token.get('token_id')
+                    if outcome and token_id:
+                        token_map[outcome] = str(token_id)
+            token_maps[condition_id] = token_map
     except Exception as e:
         print(f"Error getting token IDs: {e}")
     
-    return token_map
+    return token_maps
+
+
+async def _get_clob_json(async_client: httpx.AsyncClient, path: str, params: Dict[str, str]) -> Any:
+    """
+    Fetch a CLOB REST endpoint and decode its JSON response.
+    
+    Args:
+        async_client: Shared httpx.AsyncClient
+        path: Endpoint path, e.g. '/midpoint'
+        params: Query parameters
+        
+    Returns:
+        Decoded JSON response
+    """
+    response = await async_client.get(f"{CLOB_HOST}{path}", params=params)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+def summarize_order_book(order_book: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Derive top-of-book prices from a CLOB order book.
+    
+    Args:
+        order_book: Order book with 'bids' and 'asks' lists of {'price', 'size'} levels
+        
+    Returns:
+        Dictionary with best_bid, best_ask, midpoint (None if a side is empty)
+        and the top 3 bids and asks, best first
+    """
+    bids = sorted(order_book.get('bids') or [], key=lambda level: float(level['price']), reverse=True)
+    asks = sorted(order_book.get('asks') or [], key=lambda level: float(level['price']))
+    best_bid = float(bids[0]['price']) if bids else None
+    best_ask = float(asks[0]['price']) if asks else None
+    
+    return {
+        'best_bid': best_bid,
+        'best_ask': best_ask,
+        'midpoint': (best_bid + best_ask) / 2 if bids and asks else None,
+        'bids': bids[:3],
+        'asks': asks[:3]
+    }
+
 
+async def _get_order_book(async_client: httpx.AsyncClient, token_id: str,
+                          ws_books: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the WebSocket book snapshot for a token, falling back to REST /book."""
+    if token_id in ws_books:
+        return ws_books[token_id]
+    return await _get_clob_json(async_client, '/book', {'token_id': token_id})
 
-def get_market_odds(client: ClobClient, market: Dict[str, Any]) -> Dict[str, Any]:
+
+async def get_market_odds_async(async_client: httpx.AsyncClient, columns: Dict[str, List[Any]], row: int,
+                                token_maps: Dict[str, Dict[str, str]],
+                                ws_books: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
     """
     Get odds/prices for a specific market.
     
+    Midpoint, buy and sell prices are derived from each outcome's order
+    book, read from the WebSocket snapshots where available and otherwise
+    requested for all outcomes at once.
+    
     Args:
-        client: ClobClient instance
-        market: Market dictionary containing market information
+        async_client: Shared httpx.AsyncClient for CLOB reads
+        columns: Normalized market columns from normalize_markets()
+        row: Index of the market within columns
+        token_maps: Mapping built by fetch_token_maps()
+        ws_books: Order book snapshots from fetch_order_books()
         
     Returns:
         Dictionary with market info and odds
     """
+    market = columns['markets'][row]
+    condition_id = columns['condition_ids'][row]
     market_info = {
         'market_id': market.get('id') or market.get('_id'),
         'question': market.get('question'),
         'slug': market.get('slug'),
         'end_date': market.get('endDate') or market.get('end_date'),
-        'condition_id': market.get('conditionId') or market.get('condition_id'),
+        'condition_id': condition_id,
         'outcomes': []
     }
     
-    # Get outcomes - could be list of strings or list of dicts
-    outcomes = market.get('outcomes', [])
-    outcome_prices_raw = market.get('outcomePrices', [])
-    condition_id = market.get('conditionId') or market.get('condition_id')
-    
     if not condition_id:
         print(f"Warning: No condition_id for market {market.get('id')}")
         return market_info
     
-    # Parse outcomes if it's a JSON string
-    if isinstance(outcomes, str):
-        try:
-            outcomes = json.loads(outcomes)
-        except:
-            pass
-    
-    # Parse outcomePrices if it's a JSON string
-    outcome_prices_list = []
-    if isinstance(outcome_prices_raw, str):
-        try:
-            outcome_prices_list = json.loads(outcome_prices_raw)
-        except:
-            pass
-    elif isinstance(outcome_prices_raw, list):
-        outcome_prices_list = outcome_prices_raw
-    elif isinstance(outcome_prices_raw, dict):
-        outcome_prices_list = list(outcome_prices_raw.values())
-    
     # Get token IDs for this condition
-    token_map = get_token_ids_for_condition(client, condition_id)
+    token_map = token_maps.get(condition_id, {})
     
-    # Extract outcome names
-    outcome_names = []
-    if isinstance(outcomes, list):
-        for outcome in outcomes:
-            if isinstance(outcome, str):
-                outcome_names.append(outcome)
-            elif isinstance(outcome, dict):
-                outcome_names.append(outcome.get('name', outcome.get('title', 'Unknown')))
-    elif isinstance(outcomes, dict):
-        outcome_names = list(outcomes.values()) if outcomes else []
+    # Process each outcome, collecting the ones we can fetch order book data for
+    priced_outcomes = []
+    for outcome_name, price in zip(columns['outcome_names'][row], columns['outcome_prices'][row]):
+        outcome_info = {
+            'outcome': outcome_name,
+            'price': price,
+            'probability': price if price else None
+        }
+        market_info['outcomes'].append(outcome_info)
+        
+        token_id = token_map.get(outcome_name)
+        if token_id:
+            priced_outcomes.append((outcome_info, token_id))
     
-    # Process each outcome
-    for idx, outcome_name in enumerate(outcome_names):
+    # Get the order book for every outcome at once; prices are derived from it
+    order_books = await asyncio.gather(
+        *(_get_order_book(async_client, token_id, ws_books) for _, token_id in priced_outcomes),
+        return_exceptions=True
+    )
+    
+    missing_midpoints = []
+    for (outcome_info, token_id), order_book in zip(priced_outcomes, order_books):
         try:
-            # Get price from outcomePrices list (index corresponds to outcome index)
-            price = None
-            if idx < len(outcome_prices_list):
-                try:
-                    price = float(outcome_prices_list[idx])
-                except (ValueError, TypeError):
-                    pass
-            
-            outcome_info = {
-                'outcome': outcome_name,
-                'price': price,
-                'probability': price if price else None
-            }
-            
-            # Try to get token_id and fetch order book data
-            token_id = token_map.get(outcome_name)
-            if token_id:
-                try:
-                    midpoint = client.get_midpoint(token_id)
-                    buy_price = client.get_price(token_id, side="BUY")
-                    sell_price = client.get_price(token_id, side="SELL")
-                    order_book = client.get_order_book(token_id)
-                    
-                    outcome_info.update({
-                        'token_id': token_id,
-                        'midpoint_price': midpoint,
-                        'buy_price': buy_price,
-                        'sell_price': sell_price,
-                        'probability': midpoint if midpoint else price,
-                        'order_book': {
-                            'bids': order_book.bids[:3] if order_book and order_book.bids else [],
-                            'asks': order_book.asks[:3] if order_book and order_book.asks else []
-                        } if order_book else None
-                    })
-                except Exception as e:
-                    outcome_info['order_book_error'] = str(e)
-            
-            market_info['outcomes'].append(outcome_info)
-            
+            if isinstance(order_book, Exception):
+                raise order_book
+            summary = summarize_order_book(order_book)
         except Exception as e:
-            print(f"Error processing outcome {outcome_name}: {e}")
-            market_info['outcomes'].append({
-                'outcome': outcome_name,
-                'error': str(e)
-            })
+            outcome_info['order_book_error'] = str(e)
+            continue
+        
+        outcome_info.update({
+            'token_id': token_id,
+            'midpoint_price': summary['midpoint'],
+            'buy_price': summary['best_ask'],
+            'sell_price': summary['best_bid'],
+            'probability': summary['midpoint'] if summary['midpoint'] else outcome_info['price'],
+            'order_book': {
+                'bids': summary['bids'],
+                'asks': summary['asks']
+            }
+        })
+        if summary['midpoint'] is None:
+            missing_midpoints.append((outcome_info, token_id))
+    
+    # Fall back to the midpoint endpoint only for books missing a side
+    midpoints = await asyncio.gather(
+        *(_get_clob_json(async_client, '/midpoint', {'token_id': token_id}) for _, token_id in missing_midpoints),
+        return_exceptions=True
+    )
+    for (outcome_info, _), midpoint_resp in zip(missing_midpoints, midpoints):
+        if isinstance(midpoint_resp, dict) and midpoint_resp.get('mid'):
+            midpoint = float(midpoint_resp['mid'])
+            outcome_info['midpoint_price'] = midpoint
+            outcome_info['probability'] = midpoint
     
     return market_info
 
 
-def fetch_markets_from_gamma_api(limit: int = 1000) -> List[Dict[str, Any]]:
+async def fetch_all_market_odds(async_client: httpx.AsyncClient, columns: Dict[str, List[Any]],
+                                rows: List[int], token_maps: Dict[str, Dict[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Get odds for several markets concurrently.
+    
+    Order books for every token are collected from a single WebSocket
+    subscription; any REST fallbacks go through the shared client.
+    
+    Args:
+        async_client: Shared httpx.AsyncClient for CLOB reads
+        columns: Normalized market columns from normalize_markets()
+        rows: Indices of the markets to fetch odds for
+        token_maps: Mapping built by fetch_token_maps()
+        
+    Returns:
+        List of market odds, in the same order as rows
+    """
+    token_ids = set()
+    for row in rows:
+        token_ids.update(token_maps.get(columns['condition_ids'][row], {}).values())
+    ws_books = await fetch_order_books(token_ids)
+    
+    return await asyncio.gather(
+        *(get_market_odds_async(async_client, columns, row, token_maps, ws_books) for row in rows)
+    )
+
+
+def create_async_client() -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP/2 client shared by all Gamma and CLOB reads.
+    
+    Reusing one keep-alive client avoids a fresh TLS handshake per request;
+    responses are requested compressed.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=20),
+        headers=COMPRESSED_HEADERS
+    )
+
+
+async def _fetch_gamma_page(async_client: httpx.AsyncClient, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Fetch a single page of markets from the Gamma API.
+    
+    Args:
+        async_client: Shared httpx.AsyncClient
+        params: Query parameters, including limit and offset
+        
+    Returns:
+        List of market dictionaries on this page
+    """
+    response = await async_client.get(f"{GAMMA_HOST}/markets", params=params)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    
+    if isinstance(data, list):
+        return data
+    elif isinstance(data, dict) and 'data' in data:
+        return data['data']
+    elif isinstance(data, dict) and 'results' in data:
+        return data['results']
+    return []
+
+
+async def fetch_markets_from_gamma_api(async_client: httpx.AsyncClient, limit: int = 1000) -> List[Dict[str, Any]]:
     """
     Fetch markets from Polymarket's Gamma API which includes full market details.
     
+    The request is split into pages of GAMMA_PAGE_SIZE that are fetched
+    concurrently and concatenated in offset order.
+    
     Args:
+        async_client: Shared httpx.AsyncClient
         limit: Maximum number of markets to fetch
         
     Returns:
         List of market dictionaries with full details
     """
-    markets = []
-    url = "https://gamma-api.polymarket.com/markets"
-    params = {
-        'active': 'true',
-        'closed': 'false',
-        'limit': limit
-    }
+    params_list = [
+        {
+            'active': 'true',
+            'closed': 'false',
+            'limit': min(GAMMA_PAGE_SIZE, limit - offset),
+            'offset': offset
+        }
+        for offset in range(0, limit, GAMMA_PAGE_SIZE)
+    ]
     
     try:
-        with httpx.Client() as client:
-            response = client.get(url, params=params, timeout=30.0)
-            response.raise_for_status()
-            data = response.json()
-            
-            if isinstance(data, list):
-                markets = data
-            elif isinstance(data, dict) and 'data' in data:
-                markets = data['data']
-            elif isinstance(data, dict) and 'results' in data:
-                markets = data['results']
-                
+        pages = await asyncio.gather(*(_fetch_gamma_page(async_client, params) for params in params_list))
     except Exception as e:
         print(f"Error fetching from Gamma API: {e}")
         return []
     
-    return markets
+    return [market for page in pages for market in page]
 
 
 def main():
     """
     Main function to fetch and display cryptocurrency market odds.
     """
+    asyncio.run(main_async())
+
+
+async def main_async():
+    """
+    Fetch, filter and display cryptocurrency market odds over one shared HTTP client.
+    """
     # Initialize read-only client (no authentication needed for market data)
-    HOST = "https://clob.polymarket.com"
-    client = ClobClient(HOST)
+    client = ClobClient(CLOB_HOST)
+    async_client = create_async_client()
     
     print("Fetching markets from Polymarket Gamma API...")
     try:
-        # Get markets from Gamma API (has full market details)
-        all_markets = fetch_markets_from_gamma_api(limit=2000)
+        # Get markets from Gamma API (has full market details), while token IDs
+        # for every condition are fetched once in the background
+        token_maps, all_markets = await asyncio.gather(
+            asyncio.to_thread(fetch_token_maps, client),
+            fetch_markets_from_gamma_api(async_client, limit=2000)
+        )
         
         if not all_markets:
             print("ERROR: No markets returned from API")
@@ -297,34 +512,32 @@ def main():
                 print(f"  Available keys: {list(market.keys())[:15]}")
             print()
         
-        # Normalize the data structure for filtering
-        normalized_markets = {'data': all_markets}
+        # Normalize into uniform columns once, so later steps need no type checks
+        columns = normalize_markets(all_markets)
         
         # Filter for cryptocurrency related markets
         print("\n" + "="*80)
         print("Filtering for cryptocurrency related markets...")
         print("="*80)
-        crypto_markets = filter_crypto_markets(normalized_markets)
-        print(f"Found {len(crypto_markets)} cryptocurrency related markets\n")
+        crypto_rows = filter_crypto_markets(columns)
+        print(f"Found {len(crypto_rows)} cryptocurrency related markets\n")
         
-        if not crypto_markets:
+        if not crypto_rows:
             print("No cryptocurrency related markets found.")
             return
         
         # Show first 20 crypto markets found
         print("\nFirst 20 cryptocurrency markets found:")
-        for i, market in enumerate(crypto_markets[:20], 1):
-            print(f"  {i}. {market.get('question', 'Unknown')}")
+        for i, row in enumerate(crypto_rows[:20], 1):
+            print(f"  {i}. {columns['question'][row] or 'Unknown'}")
         print()
         
         # Get odds for each market (limit to first 20 for faster processing)
-        limit = min(20, len(crypto_markets))
+        limit = min(20, len(crypto_rows))
         print(f"Processing first {limit} markets for detailed odds...\n")
-        results = []
-        for i, market in enumerate(crypto_markets[:limit], 1):
-            print(f"Processing market {i}/{limit}: {market.get('question', 'Unknown')[:80]}...")
-            market_odds = get_market_odds(client, market)
-            results.append(market_odds)
+        for i, row in enumerate(crypto_rows[:limit], 1):
+            print(f"Processing market {i}/{limit}: {(columns['question'][row] or 'Unknown')[:80]}...")
+        results = await fetch_all_market_odds(async_client, columns, crypto_rows[:limit], token_maps)
         
         # Display results
         print("\n" + "="*80)
@@ -353,13 +566,15 @@ def main():
         
         # Save results to JSON file
         output_file = 'crypto_odds.json'
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2))
         print(f"\nResults saved to {output_file}")
         
     except Exception as e:
         print(f"Error fetching markets: {e}")
         raise
+    finally:
+        await async_client.aclose()
 
 
 if __name__ == "__main__":
@@ -1,48 +1,30 @@
 """
-Script to fetch odds for all cryptocurrency related markets on Polymarket.
+Script to fetch odds for all Federal Reserve related markets on Polymarket.
 """
 from py_clob_client.client import ClobClient
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from filters import make_filter
+import orjson
 from typing import List, Dict, Any
 
+# Number of markets whose odds are fetched concurrently
+MAX_WORKERS = 16
 
-def filter_crypto_markets(markets: Dict[str, Any]) -> List[Dict[str, Any]]:
+# Predicate for Federal Reserve / interest rate markets, compiled once in filters.py
+is_fed_market = make_filter('fed')
+
+
+def filter_fed_markets(markets: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
-    Filter markets to only include those related to cryptocurrencies.
+    Filter markets to only include those related to the Federal Reserve.
     
     Args:
         markets: Dictionary containing market data from get_simplified_markets()
         
     Returns:
-        List of markets that contain crypto-related terms in their title or description
+        List of markets that contain Fed-related terms in their title or description
     """
-    crypto_markets = []
-    search_terms = [
-        'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'cryptocurrency',
-        'solana', 'sol', 'cardano', 'ada', 'polygon', 'matic',
-        'avalanche', 'avax', 'chainlink', 'link', 'uniswap', 'uni',
-        'litecoin', 'ltc', 'dogecoin', 'doge', 'xrp', 'ripple',
-        'polkadot', 'dot', 'cosmos', 'atom', 'algorand', 'algo',
-        'price', 'usd', 'market cap', 'trading', 'exchange'
-    ]
-    
-    if 'data' not in markets:
-        return crypto_markets
-    
-    for market in markets['data']:
-        # Check various fields for cryptocurrency related content
-        market_text = ' '.join([
-            market.get('question', ''),
-            market.get('description', ''),
-            market.get('slug', ''),
-            market.get('title', '')
-        ]).lower()
-        
-        # Check if any search term appears in the market text
-        if any(term in market_text for term in search_terms):
-            crypto_markets.append(market)
-    
-    return crypto_markets
+    return [market for market in markets.get('data', []) if is_fed_market(market)]
 
 
 def get_market_odds(client: ClobClient, market: Dict[str, Any]) -> Dict[str, Any]:
@@ -73,26 +55,30 @@ def get_market_odds(client: ClobClient, market: Dict[str, Any]) -> Dict[str, Any
             continue
             
         try:
-            # Get midpoint price (current odds)
-            midpoint = client.get_midpoint(token_id)
-            
-            # Get buy and sell prices
-            buy_price = client.get_price(token_id, side="BUY")
-            sell_price = client.get_price(token_id, side="SELL")
-            
-            # Get order book for more detailed information
+            # A single order book request; midpoint, buy and sell prices come from its top of book
             order_book = client.get_order_book(token_id)
+            bids = sorted(order_book.bids or [], key=lambda level: float(level.price), reverse=True) if order_book else []
+            asks = sorted(order_book.asks or [], key=lambda level: float(level.price)) if order_book else []
+            best_bid = float(bids[0].price) if bids else None
+            best_ask = float(asks[0].price) if asks else None
+            
+            if bids and asks:
+                midpoint = (best_bid + best_ask) / 2
+            else:
+                # Fall back to the midpoint endpoint only when the book is missing a side
+                midpoint_resp = client.get_midpoint(token_id)
+                midpoint = float(midpoint_resp['mid']) if midpoint_resp and midpoint_resp.get('mid') else None
             
             outcome_info = {
                 'outcome': outcome.get('title', outcome.get('name', 'Unknown')),
                 'token_id': token_id,
                 'midpoint_price': midpoint,
-                'buy_price': buy_price,
-                'sell_price': sell_price,
+                'buy_price': best_ask,
+                'sell_price': best_bid,
                 'probability': midpoint if midpoint else None,  # Midpoint is the implied probability
                 'order_book': {
-                    'bids': order_book.bids[:3] if order_book.bids else [],  # Top 3 bids
-                    'asks': order_book.asks[:3] if order_book.asks else []   # Top 3 asks
+                    'bids': bids[:3],  # Top 3 bids
+                    'asks': asks[:3]   # Top 3 asks
                 } if order_book else None
             }
             
@@ -112,7 +98,7 @@ def get_market_odds(client: ClobClient, market: Dict[str, Any]) -> Dict[str, Any
 
 def main():
     """
-    Main function to fetch and display cryptocurrency market odds.
+    Main function to fetch and display Federal Reserve market odds.
     """
     # Initialize read-only client (no authentication needed for market data)
     HOST = "https://clob.polymarket.com"
@@ -124,25 +110,29 @@ def main():
         all_markets = client.get_simplified_markets()
         print(f"Found {len(all_markets.get('data', []))} total markets")
         
-        # Filter for cryptocurrency related markets
-        print("\nFiltering for cryptocurrency related markets...")
-        crypto_markets = filter_crypto_markets(all_markets)
-        print(f"Found {len(crypto_markets)} cryptocurrency related markets\n")
+        # Filter for Federal Reserve related markets
+        print("\nFiltering for Federal Reserve related markets...")
+        fed_markets = filter_fed_markets(all_markets)
+        print(f"Found {len(fed_markets)} Federal Reserve related markets\n")
         
-        if not crypto_markets:
-            print("No cryptocurrency related markets found.")
+        if not fed_markets:
+            print("No Federal Reserve related markets found.")
             return
         
         # Get odds for each market
-        results = []
-        for i, market in enumerate(crypto_markets, 1):
-            print(f"Processing market {i}/{len(crypto_markets)}: {market.get('question', 'Unknown')[:80]}...")
-            market_odds = get_market_odds(client, market)
-            results.append(market_odds)
+        # The read-only client keeps no per-request state, so workers share it
+        results = [None] * len(fed_markets)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {}
+            for i, market in enumerate(fed_markets):
+                print(f"Processing market {i + 1}/{len(fed_markets)}: {market.get('question', 'Unknown')[:80]}...")
+                futures[executor.submit(get_market_odds, client, market)] = i
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
         
         # Display results
         print("\n" + "="*80)
-        print("CRYPTOCURRENCY MARKET ODDS")
+        print("FEDERAL RESERVE MARKET ODDS")
         print("="*80 + "\n")
         
         for result in results:
@@ -166,9 +156,9 @@ def main():
             print("\n" + "-"*80 + "\n")
         
         # Save results to JSON file
-        output_file = 'crypto_odds.json'
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        output_file = 'federal_reserve_odds.json'
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2))
         print(f"\nResults saved to {output_file}")
         
     except Exception as e:
@@ -0,0 +1,128 @@
+"""
+Topic filters shared by the market odds scripts.
+"""
+import re
+from bisect import bisect_right
+from typing import List, Dict, Any, Callable, Pattern
+
+# Terms that mark a market as related to each topic
+TOPIC_TERMS = {
+    'crypto': [
+        'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'cryptocurrency',
+        'solana', 'sol', 'cardano', 'ada', 'polygon', 'matic',
+        'avalanche', 'avax', 'chainlink', 'link', 'uniswap', 'uni',
+        'litecoin', 'ltc', 'dogecoin', 'doge', 'xrp', 'ripple',
+        'polkadot', 'dot', 'cosmos', 'atom', 'algorand', 'algo',
+        'shiba', 'shib', 'tether', 'usdt', 'usdc', 'binance', 'bnb',
+        'terra', 'luna', 'stellar', 'xlm', 'monero', 'xmr',
+        'eos', 'tezos', 'xtz', 'dash', 'zcash', 'zec',
+        'defi', 'web3', 'blockchain'
+    ],
+    'fed': [
+        'fed', 'federal reserve', 'fomc', 'powell',
+        'rate cut', 'rate cuts', 'rate hike', 'rate hikes',
+        'interest rate', 'interest rates', 'basis point', 'basis points', 'bps'
+    ]
+}
+
+# Market fields searched for topic terms, in the order they are checked
+MARKET_TEXT_FIELDS = (
+    'question', 'description', 'slug', 'title',
+    'name', 'text', 'market', 'condition'
+)
+
+# ASCII-only lowercasing table; search text is lowercased with str.translate
+LOWER_TABLE = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+
+def _sorted_terms(terms: List[str]) -> List[str]:
+    """Lowercase and deduplicate search terms, longest first for the regex alternation."""
+    return sorted({term.lower() for term in terms}, key=lambda term: (-len(term), term))
+
+
+# Compiled once per topic: whole-word match against any term, run on lowercased text.
+# Unicode \b keeps 'sol' out of 'Solís' but still matches 'Bitcoin’s' or 'BTC\xa0price'.
+TOPIC_PATTERNS = {
+    topic: re.compile(
+        r'\b(?:' + '|'.join(re.escape(term) for term in _sorted_terms(terms)) + r')\b'
+    )
+    for topic, terms in TOPIC_TERMS.items()
+}
+
+
+def get_pattern(topic: str) -> Pattern[str]:
+    """
+    Get the compiled pattern for a topic.
+    
+    Args:
+        topic: Key of TOPIC_TERMS, e.g. 'crypto' or 'fed'
+    
+    Returns:
+        Compiled str pattern, matched against text lowercased with LOWER_TABLE
+    """
+    if topic not in TOPIC_PATTERNS:
+        raise ValueError(f"Unknown topic '{topic}', expected one of {sorted(TOPIC_PATTERNS)}")
+    return TOPIC_PATTERNS[topic]
+
+
+def search_column(pattern: Pattern[str], values: List[str], rows: List[int]) -> List[int]:
+    """
+    Find the rows whose value matches a topic pattern in a single regex sweep.
+    
+    The selected values are joined with newlines (which no search term
+    contains), lowercased with LOWER_TABLE and scanned as one string. After a hit the scan resumes at the next row, so Python only
+    iterates once per matching row.
+    
+    Args:
+        pattern: Pattern from get_pattern()
+        values: Column of string values
+        rows: Indices of the rows to search
+    
+    Returns:
+        Matching row indices, in ascending order of position in rows
+    """
+    selected = [values[row] for row in rows]
+    starts = []
+    offset = 0
+    for value in selected:
+        starts.append(offset)
+        offset += len(value) + 1
+    text = '\n'.join(selected).translate(LOWER_TABLE)
+    
+    matched = []
+    search = pattern.search
+    match = search(text)
+    while match:
+        idx = bisect_right(starts, match.start()) - 1
+        matched.append(rows[idx])
+        if idx + 1 == len(starts):
+            break
+        match = search(text, starts[idx + 1])
+    return matched
+
+
+def make_filter(topic: str) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Build a predicate that checks a single market against a topic.
+    
+    Fields are searched in MARKET_TEXT_FIELDS order, stopping at the first
+    match.
+    
+    Args:
+        topic: Key of TOPIC_TERMS, e.g. 'crypto' or 'fed'
+    
+    Returns:
+        Function taking a market dictionary and returning True if it matches
+    """
+    search = get_pattern(topic).search
+    
+    def matches(market: Dict[str, Any]) -> bool:
+        for field in MARKET_TEXT_FIELDS:
+            value = market.get(field)
+            if value:
+                text = value if isinstance(value, str) else str(value)
+                if search(text.translate(LOWER_TABLE)):
+                    return True
+        return False
+    
+    return matches